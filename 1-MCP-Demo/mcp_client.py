@@ -1,8 +1,32 @@
-import requests
+import asyncio
 
+import httpx
+from fastmcp import Client
 
-def test_multiply(a, b):
-    response = requests.post("http://127.0.0.1:7777/shwa/mcp/multiply", json={"a": a, "b": b})
+from mcp_server import mcp
+
+
+## Module-level async client so repeated tool calls reuse one pooled TCP
+## connection instead of paying a fresh handshake per request. Created once
+## at app scope (not per-call) to preserve connection reuse.
+_client = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=30.0,
+    ),
+    timeout=httpx.Timeout(5.0, connect=1.0),
+)
+
+async def aclose():
+    ## Close the pooled connections on the loop that opened them — an
+    ## atexit hook runs after the loop is gone and can't do this. Callers
+    ## should await this before their asyncio.run returns.
+    await _client.aclose()
+
+
+async def test_multiply(a, b):
+    response = await _client.post("http://127.0.0.1:7777/shwa/mcp/multiply", json={"a": a, "b": b})
 
     if response.status_code == 200:
         print("Multiplication MCP Tool Called Successfully! ✔🌹✔")
@@ -11,5 +35,43 @@ def test_multiply(a, b):
         print("Error Accessing MCP Multiplication Tool! ❌🚨❌")
 
 
+async def multiply_in_memory(a, b):
+    ## For co-hosted callers, skip sockets and JSON-over-HTTP entirely:
+    ## the in-memory transport talks to the FastMCP instance directly
+    async with Client(mcp) as client:
+        result = await client.call_tool("multiply", {"a": a, "b": b})
+
+    print("Multiplication MCP Tool Called In-Memory! ✔🌹✔")
+    print("Result:", result.content[0].text)
+
+
+async def batch_multiply(pairs):
+    ## Fan out all the tool calls concurrently; wall time is ~1 round-trip
+    ## instead of one round-trip per pair
+    return await asyncio.gather(*[test_multiply(a, b) for a, b in pairs])
+
+
+async def test_multiply_batch(pairs):
+    ## Ship the whole batch as a single request — amortizes the HTTP
+    ## overhead to 1/N per pair instead of paying it on every call
+    response = await _client.post(
+        "http://127.0.0.1:7777/shwa/mcp/multiply_batch",
+        json=[list(pair) for pair in pairs],
+    )
+
+    if response.status_code == 200:
+        print("Batch Multiplication MCP Tool Called Successfully! ✔🌹✔")
+        print("Results:", response.json()["results"])
+    else:
+        print("Error Accessing Batch MCP Multiplication Tool! ❌🚨❌")
+
+
+async def main():
+    await multiply_in_memory(6, 5)
+
+    ## Shut the HTTP pool down while the loop is still running
+    await aclose()
+
+
 if __name__ == "__main__":
-    test_multiply(6, 5)
+    asyncio.run(main())
@@ -1,22 +1,68 @@
+import socket
+from functools import lru_cache
+
 from fastmcp import FastMCP
 from fastapi import FastAPI, Body
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 import uvicorn
 
 
-app = FastAPI()
+## ORJSONResponse serializes responses with orjson's C encoder
+app = FastAPI(default_response_class=ORJSONResponse)
+
+
+class MulReq(BaseModel):
+    a: int
+    b: int
 
 mcp = FastMCP("Demo MCP Server")
 
-## @mcp.tool() --> Erorr TypeError: 'FunctionTool' object is not callable
-mcp.tool()
-def multiply(a, b):
+## Registered via mcp.tool(multiply) below instead of @mcp.tool(), which
+## would rebind the name to a FunctionTool ('FunctionTool' object is not
+## callable) and break the HTTP endpoint's direct call
+def multiply(a: int, b: int) -> int:
+    """
+    Multiply two numbers together
+    """
     return a * b
 
 
+mcp.tool(multiply)
+
+## Memoized variant for the HTTP endpoints. multiply is pure, so identical
+## inputs always give the same result; kept separate because FastMCP can't
+## build a schema from an lru_cache wrapper, so the plain function must be
+## the one registered above
+multiply_cached = lru_cache(maxsize=4096)(multiply)
+
+
 @app.post("/shwa/mcp/multiply")
-def call_multiply(data: dict=Body(...)):
+def call_multiply(req: MulReq):
+    ## Pydantic parses and validates the body in compiled code and rejects
+    ## bad input early, instead of silently defaulting via dict.get
     return {
-        "result": multiply(data.get("a", 0), data.get("b", 0))
+        "result": multiply_cached(req.a, req.b)
+    }
+
+@app.post("/shwa/mcp/multiply_batch")
+def call_multiply_batch(pairs: list[tuple[int, int]] = Body(...)):
+    ## One HTTP round-trip for the whole batch instead of one per pair
+    return {
+        "results": [multiply_cached(a, b) for a, b in pairs]
+    }
+
+@app.get("/shwa/mcp/stats")
+def stats():
+    ## Cache hit ratios show whether the memoization is actually paying off
+    info = multiply_cached.cache_info()
+    return {
+        "multiply_cache": {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
     }
 
 @app.get("/")
@@ -27,4 +73,14 @@ def home():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="127.0.0.1", port=7777)
+    ## Bind the listening socket ourselves so TCP_NODELAY is set before
+    ## uvicorn starts accepting; accepted connections inherit it, avoiding
+    ## Nagle's ~40ms delay on the small JSON responses this server returns
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.bind(("127.0.0.1", 7777))
+
+    ## uvloop + httptools: the C-accelerated event loop and HTTP parser
+    config = uvicorn.Config(app, loop="uvloop", http="httptools")
+    uvicorn.Server(config).run(sockets=[sock])
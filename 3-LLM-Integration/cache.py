@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+
+class CacheBackend(Protocol):
+    """
+    Minimal async cache interface.
+
+    Any backend implementing get/set/delete can be plugged into the client
+    (in-memory LRU below, Redis, or an embedding-based semantic cache).
+    """
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class InMemoryCache:
+    """
+    In-memory LRU cache with TTL expiry.
+
+    Args:
+        maxsize: Maximum number of entries before the least recently
+            used one is evicted.
+        ttl: Time-to-live for each entry in seconds.
+    """
+
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing/expired."""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        expires_at, value = entry
+
+        ## Drop expired entries lazily on lookup
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+
+        ## Mark as recently used
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+
+    async def set(self, key: str, value: str) -> None:
+        """Store value under key, evicting the LRU entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+    async def delete(self, key: str) -> None:
+        """Remove key from the cache if present."""
+        self._entries.pop(key, None)
@@ -1,20 +1,38 @@
 import asyncio
-import json
+import hashlib
 from contextlib import AsyncExitStack
 from typing import Any, Dict, List, Optional
 
+import httpx
 import nest_asyncio
 from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from groq import AsyncGroq
+from opentelemetry import trace
+import orjson
 
-## Apply nest_asyncio to allow nested event loops (needed for Jupyter/IPython)
-nest_asyncio.apply()
+from cache import CacheBackend, InMemoryCache
+
+## No-op unless an OpenTelemetry SDK + exporter is configured, so tracing
+## costs nothing in plain runs
+tracer = trace.get_tracer(__name__)
+
+## Only patch in nested-event-loop support when a loop is already running
+## (Jupyter/IPython). nest_asyncio forces the pure-Python event loop, which
+## would block uvloop's faster C implementation in normal runs.
+try:
+    asyncio.get_running_loop()
+    nest_asyncio.apply()
+except RuntimeError:
+    pass
 
 ## Load environment variables
 load_dotenv()
 
+## Tool-argument payloads above this size are parsed off the event loop
+LARGE_ARGS_THRESHOLD = 64_000
+
 
 class MCPGroqClient:
     """
@@ -22,20 +40,53 @@ class MCPGroqClient:
     """
 
 
-    def __init__(self, model: str = "llama-3.3-70b-versatile"):
+    def __init__(
+        self,
+        model: str = "llama-3.3-70b-versatile",
+        response_cache: Optional[CacheBackend] = None,
+        tool_cache: Optional[CacheBackend] = None,
+        tools_refresh_interval: float = 60.0,
+    ):
         """
         Initialize the Groq MCP client.
 
         Args:
             model: The Groq model to use.
+            response_cache: Cache backend for full query responses.
+                Defaults to an in-memory LRU with TTL.
+            tool_cache: Cache backend for individual tool-call results.
+                Only tools annotated idempotent/read-only are cached.
+                Defaults to an in-memory LRU with TTL.
+            tools_refresh_interval: Seconds between background refreshes
+                of the tools cache.
         """
         ## Initialize session and client objects
         self.session: Optional[ClientSession] = None
         self.exit_stack = AsyncExitStack()
-        self.groq_client = AsyncGroq()
+        ## Explicit connection pool so concurrent requests don't serialize
+        ## on the SDK's defaults; HTTP/2 multiplexes them over one TCP+TLS
+        ## session
+        self.groq_client = AsyncGroq(
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                http2=True,
+            )
+        )
         self.model = model
         self.stdio: Optional[Any] = None
         self.write: Optional[Any] = None
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self.response_cache = response_cache or InMemoryCache()
+        self.tool_cache = tool_cache or InMemoryCache()
+        self._cacheable_tools: set = set()
+        self.tools_refresh_interval = tools_refresh_interval
+        self._tools_hash: Optional[str] = None
+        self._refresh_task: Optional[asyncio.Task] = None
 
 
     async def connect_to_server(self, server_script_path: str = "server.py"):
@@ -63,11 +114,16 @@ class MCPGroqClient:
         ## Initialize the connection
         await self.session.initialize()
 
-        ## List available tools
-        tools_result = await self.session.list_tools()
+        ## List available tools and cache them in Groq format, so queries
+        ## don't pay a list_tools round-trip + schema rebuild every time
+        await self.refresh_tools()
         print("\n🛠  Connected to server with tools 🛠")
-        for tool in tools_result.tools:
-            print(f"  - {tool.name}: {tool.description}")
+        for tool in self._tools_cache:
+            print(f"  - {tool['function']['name']}: {tool['function']['description']}")
+
+        ## Keep the cache fresh out-of-band so the query path never has to
+        ## poll list_tools itself
+        self._refresh_task = asyncio.create_task(self._refresh_tools_loop())
 
 
     async def get_mcp_tools(self) -> List[Dict[str, Any]]:
@@ -75,10 +131,25 @@ class MCPGroqClient:
         Get available tools from the MCP server in Groq format.
 
         Returns:
-            A list of tools in Groq format.
+            A list of tools in Groq format (cached at connect time).
+        """
+        if self._tools_cache is None:
+            await self.refresh_tools()
+        return self._tools_cache
+
+
+    async def refresh_tools(self) -> List[Dict[str, Any]]:
+        """
+        Re-fetch the tool list from the MCP server and rebuild the cache.
+
+        Only needed if the server's tool set changes mid-session.
+
+        Returns:
+            The refreshed list of tools in Groq format.
         """
-        tools_result = await self.session.list_tools()
-        return [
+        with tracer.start_as_current_span("mcp.list_tools"):
+            tools_result = await self.session.list_tools()
+        tools = [
             {
                 "type": "function",
                 "function": {
@@ -90,6 +161,36 @@ class MCPGroqClient:
             for tool in tools_result.tools
         ]
 
+        ## Skip the rebuild entirely when the tool set hasn't changed, so
+        ## cached responses keyed on it stay valid
+        tools_hash = hashlib.sha256(orjson.dumps(tools, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        if tools_hash == self._tools_hash:
+            return self._tools_cache
+
+        ## Tools the server marks read-only/idempotent are safe to cache;
+        ## stateful tools must always go through session.call_tool
+        self._cacheable_tools = {
+            tool.name
+            for tool in tools_result.tools
+            if tool.annotations
+            and (tool.annotations.readOnlyHint or tool.annotations.idempotentHint)
+        }
+
+        self._tools_cache = tools
+        self._tools_hash = tools_hash
+        return self._tools_cache
+
+
+    async def _refresh_tools_loop(self):
+        """Background task: periodically refresh the tools cache."""
+        while True:
+            await asyncio.sleep(self.tools_refresh_interval)
+            try:
+                await self.refresh_tools()
+            except Exception:
+                ## Keep serving the previous cache if one refresh fails
+                continue
+
 
     async def process_query(self, query: str) -> str:
         """
@@ -99,18 +200,49 @@ class MCPGroqClient:
             query: The user query.
 
         Returns:
-            The response from Groq.
+            The full response from Groq.
+        """
+        ## Drain the streaming path so both entry points share one code path
+        parts = []
+        async for token in self.process_query_stream(query):
+            parts.append(token)
+        return "".join(parts)
+
+
+    async def process_query_stream(self, query: str):
+        """
+        Process a query using Groq and available MCP tools, streaming the
+        final response.
+
+        Yields tokens as they arrive so callers can show output at
+        time-to-first-token instead of waiting for the full completion.
+
+        Args:
+            query: The user query.
+
+        Yields:
+            Response text chunks from Groq.
         """
         ## Get available tools
         tools = await self.get_mcp_tools()
 
+        ## Short-circuit on a cached response for the same (model, query,
+        ## tool set) — skips both Groq calls and any tool round-trips
+        cache_key = self._response_cache_key(query, tools)
+        if (cached := await self.response_cache.get(cache_key)) is not None:
+            yield cached
+            return
+
         ## Initial Groq API call
-        response = await self.groq_client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": query}],
-            tools=tools,
-            tool_choice="auto",
-        )
+        with tracer.start_as_current_span(
+            "groq.chat.completions", attributes={"groq.model": self.model}
+        ):
+            response = await self.groq_client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": query}],
+                tools=tools,
+                tool_choice="auto",
+            )
 
         ## Get assistant's response
         assistant_message = response.choices[0].message
@@ -123,39 +255,135 @@ class MCPGroqClient:
 
         ## Handle tool calls if present
         if assistant_message.tool_calls:
-            # Process each tool call
-            for tool_call in assistant_message.tool_calls:
-                # Execute tool call
-                result = await self.session.call_tool(
-                    tool_call.function.name,
-                    arguments=json.loads(tool_call.function.arguments),
-                )
+            # Dispatch all tool calls concurrently (cached for idempotent
+            # tools); wall time is ~the slowest call instead of the sum
+            results = await asyncio.gather(
+                *[
+                    self._call_tool_cached(
+                        tool_call.function.name,
+                        tool_call.function.arguments,
+                    )
+                    for tool_call in assistant_message.tool_calls
+                ]
+            )
 
-                # Add tool response to conversation
+            # Add tool responses to conversation, preserving call order
+            for tool_call, content in zip(assistant_message.tool_calls, results):
                 messages.append(
                     {
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": result.content[0].text,
+                        "content": content,
                     }
                 )
 
-            # Get final response from Groq with tool results
-            final_response = await self.groq_client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=tools,
-                tool_choice="none",  # Don't allow more tool calls
-            )
+            # Stream the final response from Groq with tool results, so the
+            # caller sees tokens at time-to-first-token
+            with tracer.start_as_current_span(
+                "groq.chat.completions", attributes={"groq.model": self.model}
+            ):
+                final_response = await self.groq_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    tools=tools,
+                    tool_choice="none",  # Don't allow more tool calls
+                    stream=True,
+                )
 
-            return final_response.choices[0].message.content
+            parts = []
+            async for chunk in final_response:
+                token = chunk.choices[0].delta.content if chunk.choices else None
+                if token:
+                    parts.append(token)
+                    yield token
+
+            await self.response_cache.set(cache_key, "".join(parts))
+            return
 
         # No tool calls, just return the direct response
-        return assistant_message.content
+        await self.response_cache.set(cache_key, assistant_message.content)
+        yield assistant_message.content
+
+
+    async def _call_tool_cached(self, name: str, raw_arguments: str) -> str:
+        """
+        Execute a tool call, serving repeats of idempotent tools from cache.
+
+        Args:
+            name: The tool name.
+            raw_arguments: The tool arguments as a JSON string.
+
+        Returns:
+            The tool result text.
+        """
+        ## Parse large payloads in a worker thread so one big argument blob
+        ## doesn't stall the other in-flight tool calls (orjson releases
+        ## the GIL, so the offload buys real parallelism)
+        if len(raw_arguments) > LARGE_ARGS_THRESHOLD:
+            arguments = await asyncio.to_thread(orjson.loads, raw_arguments)
+        else:
+            arguments = orjson.loads(raw_arguments)
+
+        cacheable = name in self._cacheable_tools
+        cache_key = f"{name}:{orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS).decode()}"
+
+        ## Skip the MCP round-trip entirely on a repeat invocation
+        if cacheable and (cached := await self.tool_cache.get(cache_key)) is not None:
+            return cached
+
+        with tracer.start_as_current_span(
+            "mcp.call_tool", attributes={"tool.name": name}
+        ):
+            result = await self.session.call_tool(name, arguments=arguments)
+        content = result.content[0].text
+
+        if cacheable:
+            await self.tool_cache.set(cache_key, content)
+
+        return content
+
+
+    def _response_cache_key(self, query: str, tools: List[Dict[str, Any]]) -> str:
+        """
+        Build a stable cache key for a query against the current tool set.
+
+        Args:
+            query: The user query.
+            tools: The tools (Groq format) available for the query.
+
+        Returns:
+            A sha256 hex digest over (model, messages, tool names).
+        """
+        payload = orjson.dumps(
+            {
+                "model": self.model,
+                "messages": [{"role": "user", "content": query}],
+                "tools": sorted(t["function"]["name"] for t in tools),
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Cache hit/miss counters, for spotting where time is going.
+
+        Returns:
+            Hit/miss counts per cache (empty for backends without stats).
+        """
+        return {
+            "response_cache": dict(getattr(self.response_cache, "stats", {})),
+            "tool_cache": dict(getattr(self.tool_cache, "stats", {})),
+        }
 
 
     async def cleanup(self):
         """Clean up resources."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
         await self.exit_stack.aclose()
 
 
@@ -169,12 +397,23 @@ async def main():
         query = "What is our company's vacation policy?"
         print(f"\n👉 Query: {query}")
 
-        response = await client.process_query(query)
-        print(f"\n🚁 Response: {response}")
+        # Stream the response as it is generated
+        print("\n🚁 Response: ", end="", flush=True)
+        async for token in client.process_query_stream(query):
+            print(token, end="", flush=True)
+        print()
     finally:
         # Ensure proper cleanup
         await client.cleanup()
 
 
 if __name__ == "__main__":
+    ## Use uvloop's libuv-based event loop when available — a drop-in
+    ## speedup for the I/O-heavy Groq and MCP calls
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
\ No newline at end of file
@@ -11,7 +11,9 @@ mcp = FastMCP(
 )
 
 
-@mcp.tool()
+## readOnlyHint/idempotentHint mark the tool as safe to cache: repeated
+## calls with the same arguments return the same result and mutate nothing
+@mcp.tool(annotations={"readOnlyHint": True, "idempotentHint": True})
 def get_knowledeg_base() -> str:
     """
     Retrieve the entire knowledge base as a formatted string.
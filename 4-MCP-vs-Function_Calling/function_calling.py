@@ -1,12 +1,19 @@
-import json
+import httpx
+import orjson
 from groq import Groq
 from tools import add
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Initialize Groq client
-groq_client = Groq()
+# Initialize Groq client with a keep-alive pool so the two completion
+# calls below reuse one TCP+TLS session instead of handshaking twice
+groq_client = Groq(
+    http_client=httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+        http2=True,
+    )
+)
 
 """
 This is a simple example to demonstrate that MCP simply enables a new way to call functions.
@@ -31,6 +38,10 @@ tools = [
     }
 ]
 
+## O(1) tool dispatch — a dict lookup instead of an if/elif chain that
+## grows with the tool set
+TOOL_REGISTRY = {"add": add}
+
 
 ## Let's Call The LLM
 response = groq_client.chat.completions.create(
@@ -43,10 +54,10 @@ response = groq_client.chat.completions.create(
 if response.choices[0].message.tool_calls:
     tool_call = response.choices[0].message.tool_calls[0]
     tool_name = tool_call.function.name
-    tool_args = json.loads(tool_call.function.arguments)
+    tool_args = orjson.loads(tool_call.function.arguments)
 
-    ## Execute directly
-    result = add(**tool_args)
+    ## Execute directly via the registry
+    result = TOOL_REGISTRY[tool_name](**tool_args)
 
     ## Send result back to model
     final_response = groq_client.chat.completions.create(
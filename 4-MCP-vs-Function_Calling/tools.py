@@ -1,5 +1,11 @@
 
 
+from functools import lru_cache
+
+
+## Safe to memoize: add is pure, so identical inputs always give the
+## same result
+@lru_cache(maxsize=4096)
 def add(a: int, b: int) -> int:
     """
     Add two numbers together